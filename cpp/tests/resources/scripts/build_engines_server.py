@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+# SPDX-FileCopyrightText: Copyright (c) 2022-2024 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# Build server for the engine build scripts, started and owned by BuildDaemon in
+# build_engines_utils.py. It imports trtllm-build once and then serves build requests from a
+# single client over a Unix domain socket, so that consecutive builds skip interpreter startup and
+# the torch/tensorrt imports. Requests and replies are newline terminated JSON objects:
+# {"argv": [...]} and {"error": null | "<traceback>"}. The server exits when the client
+# disconnects, or when no client connects within --connect_timeout seconds.
+
+import argparse as _arg
+import json as _json
+import os as _os
+import pathlib as _pl
+import socket as _socket
+import sys as _sys
+import traceback as _tb
+
+
+def serve(socket_path: str, connect_timeout: float) -> None:
+    from tensorrt_llm.commands import build as _trtllm_build
+
+    with _socket.socket(_socket.AF_UNIX, _socket.SOCK_STREAM) as server:
+        server.bind(socket_path)
+        try:
+            server.listen(1)
+            server.settimeout(connect_timeout)
+            try:
+                conn, _ = server.accept()
+            except _socket.timeout:
+                return
+            conn.settimeout(None)
+            with conn, conn.makefile("rw") as stream:
+                for line in stream:
+                    _sys.argv = _json.loads(line)["argv"]
+                    try:
+                        _trtllm_build.main()
+                        error = None
+                    except BaseException:
+                        error = _tb.format_exc()
+                    stream.write(_json.dumps({"error": error}) + "\n")
+                    stream.flush()
+        finally:
+            _pl.Path(socket_path).unlink(missing_ok=True)
+
+
+if __name__ == "__main__":
+    parser = _arg.ArgumentParser()
+    parser.add_argument("--socket",
+                        type=str,
+                        required=True,
+                        help="Path of the Unix domain socket to listen on")
+    parser.add_argument(
+        "--gpu_id",
+        type=str,
+        default=None,
+        help="GPU to build on, exported as CUDA_VISIBLE_DEVICES")
+    parser.add_argument("--connect_timeout",
+                        type=float,
+                        default=600,
+                        help="Seconds to wait for the client before exiting")
+    args = parser.parse_args()
+
+    # Must be set before anything initializes CUDA in this process.
+    if args.gpu_id is not None:
+        _os.environ["CUDA_VISIBLE_DEVICES"] = args.gpu_id
+
+    serve(args.socket, args.connect_timeout)
@@ -14,17 +14,29 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import concurrent.futures as _cf
+import hashlib as _hashlib
+import json as _json
 import logging as _log
 import os as _os
 import pathlib as _pl
+import shutil as _shutil
+import socket as _socket
 import subprocess as _sp
+import sys as _sys
+import tempfile as _tempfile
+import threading as _th
+import time as _time
 import typing as _tp
+from contextlib import nullcontext as _nullcontext
 
 
 def run_command(command: _tp.Sequence[str],
                 *,
                 cwd=None,
                 timeout=None,
+                log_file: _tp.Optional[_pl.Path] = None,
+                log_prefix: str = "",
                 **kwargs) -> None:
     _log.info("Running: cd %s && %s", str(cwd), " ".join(command))
     override_timeout = int(_os.environ.get("CPP_TEST_TIMEOUT_OVERRIDDEN", "-1"))
@@ -32,7 +44,231 @@ def run_command(command: _tp.Sequence[str],
         _log.info("Overriding the command timeout: %s (before) and %s (after)",
                   timeout, override_timeout)
         timeout = override_timeout
-    _sp.check_call(command, cwd=cwd, timeout=timeout, **kwargs)
+    if not kwargs.get("shell") and "executable" not in kwargs:
+        # CPython launches children with posix_spawn instead of fork only for
+        # an absolute executable path without cwd and close_fds. Descriptors
+        # are non-inheritable by default (PEP 446), so close_fds can be off.
+        kwargs["executable"] = _shutil.which(command[0]) or command[0]
+        kwargs.setdefault("close_fds", False)
+    if log_file is None and not log_prefix:
+        _sp.check_call(command, cwd=cwd, timeout=timeout, **kwargs)
+        return
+
+    # Stream the combined output line by line so that concurrent commands stay
+    # readable, copying it to the log file if one is given.
+    with _sp.Popen(command,
+                   cwd=cwd,
+                   stdout=_sp.PIPE,
+                   stderr=_sp.STDOUT,
+                   bufsize=1,
+                   text=True,
+                   **kwargs) as process, (open(log_file, "w") if log_file else
+                                          _nullcontext()) as log:
+
+        def forward_output():
+            for line in process.stdout:
+                _sys.stderr.write(log_prefix + line)
+                if log:
+                    log.write(line)
+
+        reader = _th.Thread(target=forward_output, daemon=True)
+        reader.start()
+        try:
+            return_code = process.wait(timeout=timeout)
+        except _sp.TimeoutExpired:
+            process.kill()
+            raise
+        finally:
+            reader.join()
+    if return_code != 0:
+        raise _sp.CalledProcessError(return_code, command)
+
+
+# Copies a single large file, e.g. model weights from the model cache. A hardlink is used when
+# both paths are on the same filesystem, otherwise the data is copied in parallel chunks with
+# copy_file_range so that it never passes through user space. Like rsync, the copy is skipped
+# when the destination has the same size and modification time as the source.
+def fastcopy(source: str,
+             dest: str,
+             num_workers: int = 8,
+             chunk_size: int = 256 * 1024 * 1024) -> None:
+    source = _pl.Path(source)
+    dest = _pl.Path(dest)
+    src_stat = source.stat()
+    if dest.exists():
+        dst_stat = dest.stat()
+        if (dst_stat.st_size, dst_stat.st_mtime_ns) == (src_stat.st_size,
+                                                        src_stat.st_mtime_ns):
+            _log.info("Skipping copy of %s, %s is up to date", str(source),
+                      str(dest))
+            return
+        dest.unlink()
+
+    _log.info("Copying %s to %s", str(source), str(dest))
+    if src_stat.st_dev == dest.parent.stat().st_dev:
+        try:
+            _os.link(source, dest)
+            return
+        except OSError:
+            pass
+
+    size = src_stat.st_size
+    with open(source, 'rb') as fsrc, open(dest, 'wb') as fdst:
+        try:
+            _os.truncate(fdst.fileno(), size)
+
+            def copy_chunk(offset):
+                end = min(offset + chunk_size, size)
+                while offset < end:
+                    copied = _os.copy_file_range(fsrc.fileno(),
+                                                 fdst.fileno(),
+                                                 end - offset,
+                                                 offset_src=offset,
+                                                 offset_dst=offset)
+                    if copied == 0:
+                        raise OSError(f"Unexpected end of file in {source}")
+                    offset += copied
+
+            with _cf.ThreadPoolExecutor(max_workers=num_workers) as executor:
+                list(executor.map(copy_chunk, range(0, size, chunk_size)))
+        except (AttributeError, OSError):
+            # copy_file_range is unavailable or unsupported by the filesystem
+            fdst.seek(0)
+            fdst.truncate()
+            fsrc.seek(0)
+            _shutil.copyfileobj(fsrc, fdst, 16 * 1024 * 1024)
+    _shutil.copystat(source, dest)
+
+
+# Downloads a single large file over HTTP with concurrent range requests written straight into
+# their offsets of the destination file. The download is skipped when the destination already
+# has the expected size. Failed ranges are retried with exponential backoff, and an interrupted
+# download resumes from the ranges recorded as complete. If sha256 is given, a fresh download is
+# verified before it replaces the destination.
+def download_file(url: str,
+                  dest: str,
+                  sha256: _tp.Optional[str] = None,
+                  num_workers: int = 8,
+                  chunk_size: int = 64 * 1024 * 1024,
+                  max_retries: int = 5) -> None:
+    import requests
+    from requests.adapters import HTTPAdapter
+
+    dest = _pl.Path(dest)
+    with requests.Session() as session:
+        adapter = HTTPAdapter(pool_connections=num_workers,
+                              pool_maxsize=2 * num_workers)
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+
+        head = session.head(url, allow_redirects=True, timeout=60)
+        head.raise_for_status()
+        size = int(head.headers["Content-Length"])
+        # Resolve redirects once, e.g. to a CDN, instead of once per range.
+        url = head.url
+
+        if dest.is_file() and dest.stat().st_size == size:
+            _log.info("Skipping download of %s, %s is up to date", url,
+                      str(dest))
+            return
+
+        part = dest.with_name(dest.name + ".part")
+        # Offsets of the ranges already written to the .part file, one per line.
+        progress = dest.with_name(dest.name + ".part.done")
+        done = set()
+        resumable = part.is_file() and part.stat().st_size == size
+        if resumable and progress.is_file():
+            done = {int(line) for line in progress.read_text().split()}
+            _log.info("Resuming download of %s, %d ranges done", url, len(done))
+        else:
+            _log.info("Downloading %s to %s", url, str(dest))
+        progress_lock = _th.Lock()
+
+        fd = _os.open(part, _os.O_WRONLY | _os.O_CREAT, 0o644)
+        try:
+            _os.truncate(fd, size)
+            with open(progress, "a" if done else "w") as progress_file:
+
+                def download_range(start):
+                    end = min(start + chunk_size, size) - 1
+                    for attempt in range(max_retries + 1):
+                        offset = start
+                        try:
+                            with session.get(
+                                    url,
+                                    headers={"Range": f"bytes={start}-{end}"},
+                                    stream=True,
+                                    timeout=60) as response:
+                                response.raise_for_status()
+                                if response.status_code != 206:
+                                    raise RuntimeError(
+                                        f"Server ignored the range request for {url}"
+                                    )
+                                for data in response.iter_content(1024 * 1024):
+                                    _os.pwrite(fd, data, offset)
+                                    offset += len(data)
+                            if offset != end + 1:
+                                raise RuntimeError(
+                                    f"Incomplete download of bytes {offset}-{end} of {url}"
+                                )
+                            break
+                        except (requests.RequestException, RuntimeError) as e:
+                            if attempt == max_retries:
+                                raise
+                            delay = 2**attempt
+                            _log.warning(
+                                "Retrying bytes %d-%d of %s in %d s: %s", start,
+                                end, url, delay, e)
+                            _time.sleep(delay)
+                    with progress_lock:
+                        progress_file.write(f"{start}\n")
+                        progress_file.flush()
+
+                pending = [
+                    offset for offset in range(0, size, chunk_size)
+                    if offset not in done
+                ]
+                with _cf.ThreadPoolExecutor(
+                        max_workers=num_workers) as executor:
+                    list(executor.map(download_range, pending))
+        finally:
+            _os.close(fd)
+        if sha256 is not None:
+            hasher = _hashlib.sha256()
+            with open(part, 'rb') as f:
+                for block in iter(lambda: f.read(16 * 1024 * 1024), b''):
+                    hasher.update(block)
+            digest = hasher.hexdigest()
+            if digest != sha256:
+                part.unlink()
+                progress.unlink()
+                raise RuntimeError(
+                    f"Checksum mismatch for {url}: expected {sha256}, got {digest}"
+                )
+        _os.replace(part, dest)
+        progress.unlink()
+
+
+def _fadvise(path, *advice: str) -> None:
+    if not hasattr(_os, "posix_fadvise"):
+        return
+    fd = _os.open(path, _os.O_RDONLY)
+    try:
+        for name in advice:
+            _os.posix_fadvise(fd, 0, 0, getattr(_os, f"POSIX_FADV_{name}"))
+    finally:
+        _os.close(fd)
+
+
+# Page cache hints for large weight files read by child processes: prefetch_file() starts
+# reading the file into the page cache ahead of the child, evict_file() drops it once no
+# further readers are expected. Both are no-ops where posix_fadvise is unavailable.
+def prefetch_file(path) -> None:
+    _fadvise(path, "SEQUENTIAL", "WILLNEED")
+
+
+def evict_file(path) -> None:
+    _fadvise(path, "DONTNEED")
 
 
 # We can't use run_command() because robocopy (Robust Copy, rsync equivalent on Windows)
@@ -64,6 +300,73 @@ def wincopy(source: str, dest: str, isdir: bool, cwd=None) -> None:
                                          output=result.stderr)
 
 
+# Long-lived build server (build_engines_server.py) that imports trtllm-build once and then runs
+# builds in-process, so repeated builds do not pay for starting Python and importing
+# torch/tensorrt each time. The server is started by and private to this object, and it exits on
+# close(), so it always runs the TensorRT-LLM and working directory of the current invocation.
+class BuildDaemon:
+
+    def __init__(self,
+                 gpu_id: _tp.Optional[str] = None,
+                 start_timeout: float = 300):
+        self._socket_dir = _tempfile.mkdtemp(prefix="trtllm-build-")
+        self._socket_path = str(_pl.Path(self._socket_dir) / "server.sock")
+        command = [
+            _sys.executable,
+            str(_pl.Path(__file__).parent / "build_engines_server.py"),
+            f"--socket={self._socket_path}"
+        ]
+        if gpu_id is not None:
+            command.append(f"--gpu_id={gpu_id}")
+        _log.info("Starting build server: %s", " ".join(command))
+        self._process = _sp.Popen(command)
+        try:
+            self._stream = self._connect(start_timeout)
+        except BaseException:
+            self._process.kill()
+            self._process.wait()
+            _shutil.rmtree(self._socket_dir, ignore_errors=True)
+            raise
+
+    def _connect(self, timeout: float):
+        deadline = _time.monotonic() + timeout
+        while _time.monotonic() < deadline:
+            if self._process.poll() is not None:
+                raise RuntimeError(
+                    f"Build server exited with code {self._process.returncode}")
+            sock = _socket.socket(_socket.AF_UNIX, _socket.SOCK_STREAM)
+            try:
+                sock.connect(self._socket_path)
+            except OSError:
+                sock.close()
+                _time.sleep(0.5)
+                continue
+            return sock.makefile("rw")
+        raise TimeoutError(
+            f"Build server did not start listening on {self._socket_path}")
+
+    def run(self, command: _tp.Sequence[str]) -> None:
+        _log.info("Running in build server: %s", " ".join(command))
+        self._stream.write(_json.dumps({"argv": list(command)}) + "\n")
+        self._stream.flush()
+        reply = self._stream.readline()
+        if not reply:
+            raise RuntimeError("Build server closed the connection")
+        error = _json.loads(reply)["error"]
+        if error is not None:
+            raise RuntimeError(f"Build server command failed:\n{error}")
+
+    def close(self) -> None:
+        # The server exits once its only client disconnects.
+        self._stream.close()
+        try:
+            self._process.wait(timeout=60)
+        except _sp.TimeoutExpired:
+            self._process.kill()
+            self._process.wait()
+        _shutil.rmtree(self._socket_dir, ignore_errors=True)
+
+
 # Helper function to locate model_spec module.
 def init_model_spec_module(force_init_trtllm_bindings=True):
     import os
@@ -15,13 +15,21 @@
 # limitations under the License.
 
 import argparse as _arg
+import concurrent.futures as _cf
+import dataclasses as _dc
+import hashlib as _hl
+import json as _json
 import os as _os
 import pathlib as _pl
 import platform as _pf
+import queue as _queue
+import shutil as _shutil
 import sys as _sys
 import typing as _tp
 
-from build_engines_utils import init_model_spec_module, run_command, wincopy
+from build_engines_utils import (BuildDaemon, download_file, evict_file,
+                                 fastcopy, init_model_spec_module,
+                                 prefetch_file, run_command, wincopy)
 
 init_model_spec_module()
 import model_spec
@@ -29,89 +37,395 @@ import model_spec
 import tensorrt_llm.bindings as _tb
 
 
-def get_ckpt_without_quatization(model_dir, output_dir):
-    build_args = [_sys.executable, "examples/gptj/convert_checkpoint.py"] + [
+def convert_checkpoint(convert_args: _tp.List[str], model_dir: _pl.Path,
+                       output_dir: _pl.Path, reuse_engines: bool) -> None:
+    # With reuse_engines, skip the conversion when the checkpoint was already
+    # produced by the same converter and arguments from the same weights.
+    converter = _pl.Path(convert_args[0])
+    cache_key = _hl.blake2b(
+        repr((convert_args, get_checkpoint_fingerprint(model_dir),
+              get_checkpoint_fingerprint(converter.parent),
+              sorted(get_toolchain_info(None).items()))).encode()).hexdigest()
+    cache_key_file = _pl.Path(output_dir) / '.cache_key'
+    if reuse_engines and cache_key_file.is_file() \
+            and cache_key_file.read_text() == cache_key \
+            and (_pl.Path(output_dir) / 'rank0.safetensors').is_file():
+        print(f"skip: checkpoint {output_dir} is up to date")
+        return
+    prefetch_file(_pl.Path(model_dir) / 'pytorch_model.bin')
+    run_command([_sys.executable] + convert_args)
+    cache_key_file.write_text(cache_key)
+
+
+def get_ckpt_without_quatization(model_dir, output_dir, reuse_engines=False):
+    convert_checkpoint([
+        "examples/gptj/convert_checkpoint.py",
         '--model_dir={}'.format(model_dir),
         '--output_dir={}'.format(output_dir),
-    ]
-    run_command(build_args)
+    ], model_dir, output_dir, reuse_engines)
 
 
-def get_ckpt_with_modelopt_quant(model_dir, output_dir, model_cache):
-    build_args = [_sys.executable, "examples/quantization/quantize.py"] + [
-        '--model_dir={}'.format(model_dir),
+def get_ckpt_with_modelopt_quant(model_dir,
+                                 output_dir,
+                                 model_cache,
+                                 reuse_engines=False):
+    convert_checkpoint([
+        "examples/quantization/quantize.py", '--model_dir={}'.format(model_dir),
         '--output_dir={}'.format(output_dir), '--qformat=fp8',
         '--kv_cache_dtype=fp8',
         f'--calib_dataset={model_cache}/datasets/cnn_dailymail'
-    ]
-    run_command(build_args)
+    ], model_dir, output_dir, reuse_engines)
+
+
+@_dc.dataclass(frozen=True)
+class BuildConfig:
+    logits_dtype: str = 'float16'
+    gemm_plugin: str = 'float16'
+    gpt_attention_plugin: str = 'float16'
+    max_batch_size: int = 32
+    max_input_len: int = 40
+    max_seq_len: int = 60
+    max_beam_width: int = 2
+    paged_kv_cache: str = 'disable'
+    remove_input_padding: str = 'disable'
+    context_fmha: str = 'disable'
+    log_level: str = 'error'
+    extra: _tp.Tuple[str, ...] = ()
 
+    def to_argv(self) -> _tp.List[str]:
+        # Canonical (sorted) argument order, so that equal configs always map
+        # to the same command line and cache key.
+        options = {
+            field.name: getattr(self, field.name)
+            for field in _dc.fields(self) if field.name != 'extra'
+        }
+        return [f'--{key}={value}'
+                for key, value in sorted(options.items())] + sorted(self.extra)
 
-def build_engine(checkpoint_dir: _pl.Path, engine_dir: _pl.Path, *args):
+
+def build_engine(checkpoint_dir: _pl.Path,
+                 engine_dir: _pl.Path,
+                 build_config: BuildConfig,
+                 gpu_id: _tp.Optional[str] = None,
+                 daemon: _tp.Optional[BuildDaemon] = None,
+                 reuse_engines: bool = False):
     build_args = ["trtllm-build"] + (
-        ['--checkpoint_dir', str(checkpoint_dir)] if checkpoint_dir else []) + [
-            '--output_dir',
-            str(engine_dir),
-            '--logits_dtype=float16',
-            '--gemm_plugin=float16',
-            '--max_batch_size=32',
-            '--max_input_len=40',
-            '--max_seq_len=60',
-            '--max_beam_width=2',
-            '--log_level=error',
-        ] + list(args)
-    run_command(build_args)
-
-
-def build_engines(model_cache: _tp.Optional[str] = None, only_fp8=False):
+        [f'--checkpoint_dir={checkpoint_dir}'] if checkpoint_dir else
+        []) + [f'--output_dir={engine_dir}'] + build_config.to_argv()
+
+    # With reuse_engines, skip the build when an engine was already produced
+    # from the same checkpoint files with the same arguments and toolchain.
+    cache_key = get_build_cache_key(checkpoint_dir, build_config, gpu_id)
+    cache_key_file = engine_dir / '.cache_key'
+    if reuse_engines and cache_key_file.is_file() \
+            and cache_key_file.read_text() == cache_key \
+            and (engine_dir / 'rank0.engine').is_file():
+        print(f"skip: engine {engine_dir} is up to date")
+        return
+
+    engine_dir.mkdir(parents=True, exist_ok=True)
+    if daemon is not None:
+        # The daemon is already pinned to its GPU.
+        daemon.run(build_args)
+    else:
+        env = None
+        if gpu_id is not None:
+            env = {**_os.environ, "CUDA_VISIBLE_DEVICES": gpu_id}
+        run_command(build_args,
+                    env=env,
+                    log_file=engine_dir / 'build.log',
+                    log_prefix=f"[{engine_dir.parent.name}] ")
+    write_build_manifest(engine_dir, checkpoint_dir, build_config, gpu_id)
+    cache_key_file.write_text(cache_key)
+
+
+def get_checkpoint_files(checkpoint_dir: _pl.Path) -> _tp.List[_pl.Path]:
+    if not checkpoint_dir:
+        return []
+    return sorted(path for path in _pl.Path(checkpoint_dir).iterdir()
+                  if path.is_file())
+
+
+def get_checkpoint_fingerprint(
+        checkpoint_dir: _pl.Path) -> _tp.List[_tp.Tuple[str, int, int]]:
+    checkpoint_files = []
+    for path in get_checkpoint_files(checkpoint_dir):
+        stat = path.stat()
+        checkpoint_files.append((path.name, stat.st_size, stat.st_mtime_ns))
+    return checkpoint_files
+
+
+def get_toolchain_info(gpu_id: _tp.Optional[str]) -> _tp.Dict[str, str]:
+    import tensorrt as trt
+    import torch
+
+    import tensorrt_llm
+    return {
+        'trtllm_version': tensorrt_llm.__version__,
+        'tensorrt_version': trt.__version__,
+        'cuda_version': torch.version.cuda,
+        'gpu_name': get_gpu_name(gpu_id),
+    }
+
+
+def get_build_cache_key(checkpoint_dir: _pl.Path, build_config: BuildConfig,
+                        gpu_id: _tp.Optional[str]) -> str:
+    return _hl.blake2b(
+        repr(
+            (build_config.to_argv(), get_checkpoint_fingerprint(checkpoint_dir),
+             sorted(get_toolchain_info(gpu_id).items()))).encode()).hexdigest()
+
+
+def write_build_manifest(engine_dir: _pl.Path, checkpoint_dir: _pl.Path,
+                         build_config: BuildConfig, gpu_id: _tp.Optional[str]):
+    manifest = {
+        'checkpoint_dir': str(checkpoint_dir),
+        'checkpoint_files': get_checkpoint_fingerprint(checkpoint_dir),
+        'args': build_config.to_argv(),
+        **get_toolchain_info(gpu_id),
+    }
+    with open(engine_dir / 'build_manifest.json', 'w') as f:
+        _json.dump(manifest, f, indent=4)
+
+
+def get_gpu_ids() -> _tp.List[str]:
+    visible_devices = _os.environ.get("CUDA_VISIBLE_DEVICES")
+    if visible_devices is not None:
+        return [d for d in visible_devices.split(",") if d.strip()]
+
+    import pynvml
+    pynvml.nvmlInit()
+    try:
+        return [str(i) for i in range(pynvml.nvmlDeviceGetCount())]
+    finally:
+        pynvml.nvmlShutdown()
+
+
+def get_gpu_name(gpu_id: _tp.Optional[str] = None) -> str:
+    # Without an explicit id, report the device the builds run on, i.e. the
+    # first one visible to this process.
+    if gpu_id is None:
+        gpu_ids = get_gpu_ids()
+        gpu_id = gpu_ids[0].strip() if gpu_ids else "0"
+
+    import pynvml
+    pynvml.nvmlInit()
+    try:
+        if gpu_id.isdigit():
+            handle = pynvml.nvmlDeviceGetHandleByIndex(int(gpu_id))
+        else:
+            # CUDA_VISIBLE_DEVICES may list devices by UUID.
+            handle = pynvml.nvmlDeviceGetHandleByUUID(gpu_id)
+        return pynvml.nvmlDeviceGetName(handle)
+    finally:
+        pynvml.nvmlShutdown()
+
+
+def build_engines_parallel(builds: _tp.Sequence[_tp.Tuple[str, _pl.Path,
+                                                          _pl.Path,
+                                                          BuildConfig]],
+                           max_parallel_builds: int = 1,
+                           use_daemon: bool = False,
+                           reuse_engines: bool = False):
+    # Builds with identical inputs produce identical engines, so only the
+    # first one runs and its output is copied to the other directories.
+    unique_builds = {}
+    duplicates = []
+    for name, checkpoint_dir, engine_dir, build_config in builds:
+        key = (str(checkpoint_dir), tuple(build_config.to_argv()))
+        if key in unique_builds:
+            duplicates.append((unique_builds[key][2], engine_dir))
+        else:
+            unique_builds[key] = (name, checkpoint_dir, engine_dir,
+                                  build_config)
+    builds = list(unique_builds.values())
+    checkpoint_dirs = sorted({str(build[1]) for build in builds})
+
+    # TensorRT tactic selection is not reliable when several builders share a
+    # GPU, so builds only overlap when each one can own a device.
+    gpu_ids = get_gpu_ids()
+    num_workers = min(max_parallel_builds, len(builds))
+    parallel = num_workers > 1 and len(gpu_ids) >= num_workers
+
+    # Several builds read the same checkpoint, so it is kept in the page
+    # cache until the last one is done.
+    for checkpoint_dir in checkpoint_dirs:
+        for path in get_checkpoint_files(checkpoint_dir):
+            prefetch_file(path)
+
+    # With use_daemon, one build daemon is started per GPU and reused by all
+    # the builds running on it.
+    daemons = {}
+
+    def get_daemon(gpu_id):
+        if not use_daemon:
+            return None
+        if gpu_id not in daemons:
+            daemons[gpu_id] = BuildDaemon(gpu_id)
+        return daemons[gpu_id]
+
+    try:
+        if not parallel:
+            for name, checkpoint_dir, engine_dir, build_config in builds:
+                print(f"\nBuilding {name} engine")
+                build_engine(checkpoint_dir,
+                             engine_dir,
+                             build_config,
+                             daemon=get_daemon(None),
+                             reuse_engines=reuse_engines)
+        else:
+            # Each running build owns one GPU, handed out round-robin.
+            free_gpus = _queue.Queue()
+            for gpu_id in gpu_ids[:num_workers]:
+                if use_daemon:
+                    get_daemon(gpu_id)
+                free_gpus.put(gpu_id)
+
+            def build_on_free_gpu(checkpoint_dir, engine_dir, build_config):
+                gpu_id = free_gpus.get()
+                try:
+                    build_engine(checkpoint_dir,
+                                 engine_dir,
+                                 build_config,
+                                 gpu_id=gpu_id,
+                                 daemon=get_daemon(gpu_id),
+                                 reuse_engines=reuse_engines)
+                finally:
+                    free_gpus.put(gpu_id)
+
+            print(f"\nBuilding {len(builds)} engines on {num_workers} GPUs")
+            failed_builds = []
+            with _cf.ThreadPoolExecutor(max_workers=num_workers) as executor:
+                futures = {
+                    executor.submit(build_on_free_gpu, *build[1:]): build
+                    for build in builds
+                }
+                for future in _cf.as_completed(futures):
+                    name = futures[future][0]
+                    try:
+                        future.result()
+                    except Exception as e:
+                        print(f"Building {name} engine failed: {e}")
+                        failed_builds.append(futures[future])
+                    else:
+                        print(f"Built {name} engine")
+
+            # Retry only the failed builds, one at a time, so that finished
+            # engines are kept and a failure caused by the concurrent builds
+            # does not repeat.
+            for name, checkpoint_dir, engine_dir, build_config in failed_builds:
+                print(f"\nRetrying {name} engine serially")
+                build_on_free_gpu(checkpoint_dir, engine_dir, build_config)
+    finally:
+        for daemon in daemons.values():
+            daemon.close()
+        for checkpoint_dir in checkpoint_dirs:
+            for path in get_checkpoint_files(checkpoint_dir):
+                evict_file(path)
+
+    for source_dir, engine_dir in duplicates:
+        print(f"Copying duplicate engine {source_dir} to {engine_dir}")
+        _shutil.copytree(source_dir, engine_dir, dirs_exist_ok=True)
+
+
+def pin_to_gpu(gpu_id: int):
+    # Restrict this script and all its children to one GPU and to the slice of
+    # CPUs matching it, so that concurrent CI jobs do not contend for devices.
+    # gpu_id indexes the GPUs visible to this job, so that a job already
+    # limited by CUDA_VISIBLE_DEVICES stays within its own devices.
+    gpu_ids = get_gpu_ids()
+    if not 0 <= gpu_id < len(gpu_ids):
+        raise ValueError(
+            f"GPU {gpu_id} is out of range, {len(gpu_ids)} GPUs are visible")
+    _os.environ["CUDA_VISIBLE_DEVICES"] = gpu_ids[gpu_id].strip()
+    if hasattr(_os, "sched_setaffinity"):
+        cpus = sorted(_os.sched_getaffinity(0))
+        cpus_per_gpu = max(len(cpus) // len(gpu_ids), 1)
+        first_cpu = gpu_id * cpus_per_gpu
+        _os.sched_setaffinity(0, cpus[first_cpu:first_cpu + cpus_per_gpu])
+
+
+FP16_CONFIGS = ("fp16-plugin", "fp16-plugin-packed", "fp16-plugin-packed-paged")
+FP8_CONFIGS = ("fp8-plugin-packed-paged", )
+
+
+def build_engines(model_cache: _tp.Optional[str] = None,
+                  only_fp8=False,
+                  configs: _tp.Optional[_tp.Iterable[str]] = None,
+                  max_parallel_builds: int = 1,
+                  daemon: bool = False,
+                  gpu_id: _tp.Optional[int] = None,
+                  reuse_engines: bool = False):
+    if gpu_id is not None:
+        pin_to_gpu(gpu_id)
+
     resources_dir = _pl.Path(__file__).parent.resolve().parent
     models_dir = resources_dir / 'models'
     model_name = 'gpt-j-6b'
+    hf_repo_id = 'EleutherAI/gpt-j-6b'
 
-    # Clone or update the model directory without lfs
     hf_dir = models_dir / model_name
-    if hf_dir.exists():
-        assert hf_dir.is_dir()
-        run_command(["git", "pull"], cwd=hf_dir)
-    else:
-        if _pf.system() == "Windows":
-            url_prefix = ""
-        else:
-            url_prefix = "file://"
-        model_url = url_prefix + str(
-            _pl.Path(model_cache) / model_name
-        ) if model_cache else "https://huggingface.co/EleutherAI/gpt-j-6b"
-        run_command([
-            "git", "clone", model_url, "--single-branch", "--no-local",
-            model_name
-        ],
-                    cwd=hf_dir.parent,
-                    env={
-                        **_os.environ, "GIT_LFS_SKIP_SMUDGE": "1"
-                    })
-
-    assert (hf_dir.is_dir())
-
-    # Download the model file
     model_file_name = "pytorch_model.bin"
+    if (hf_dir / ".git").is_dir():
+        # Update a checkout created by an earlier git based download. Only the
+        # latest revision is fetched and LFS files are left to the download
+        # below.
+        git_env = {**_os.environ, "GIT_LFS_SKIP_SMUDGE": "1"}
+        run_command(["git", "fetch", "--depth=1", "origin", "main"],
+                    cwd=hf_dir,
+                    env=git_env)
+        run_command(["git", "reset", "--hard", "origin/main"],
+                    cwd=hf_dir,
+                    env=git_env)
+
+    # The models directory does not exist on a fresh checkout.
+    hf_dir.mkdir(parents=True, exist_ok=True)
+    expected_model_size = None
     if model_cache:
+        model_cache_dir = _pl.Path(model_cache) / model_name
+        _shutil.copytree(model_cache_dir,
+                         hf_dir,
+                         ignore=_shutil.ignore_patterns(".git",
+                                                        model_file_name),
+                         dirs_exist_ok=True)
+
         if _pf.system() == "Windows":
-            wincopy(source=str(
-                _pl.Path(model_cache) / model_name / model_file_name),
+            wincopy(source=str(model_cache_dir / model_file_name),
                     dest=model_file_name,
                     isdir=False,
                     cwd=hf_dir)
         else:
-            run_command([
-                "rsync", "-rlptD",
-                str(_pl.Path(model_cache) / model_name / model_file_name), "."
-            ],
-                        cwd=hf_dir)
+            fastcopy(source=str(model_cache_dir / model_file_name),
+                     dest=str(hf_dir / model_file_name))
     else:
-        run_command(["git", "lfs", "pull", "--include", model_file_name],
-                    cwd=hf_dir)
+        from huggingface_hub import (get_hf_file_metadata, hf_hub_url,
+                                     snapshot_download)
 
-    assert ((hf_dir / model_file_name).is_file())
+        # Fetches with parallel HTTP requests and skips up to date files,
+        # avoiding the git-lfs smudge filter.
+        snapshot_download(repo_id=hf_repo_id,
+                          allow_patterns=["*.json", "*.txt"],
+                          local_dir=hf_dir,
+                          max_workers=8)
+        # The size and sha256 of the LFS object let truncated or corrupted
+        # downloads fail here instead of in the middle of an engine build.
+        model_url = hf_hub_url(hf_repo_id, model_file_name)
+        model_metadata = get_hf_file_metadata(model_url)
+        download_file(url=model_url,
+                      dest=str(hf_dir / model_file_name),
+                      sha256=model_metadata.etag)
+        expected_model_size = model_metadata.size
+
+    model_file = hf_dir / model_file_name
+    try:
+        model_size = model_file.stat().st_size
+    except FileNotFoundError:
+        raise FileNotFoundError(
+            f"Expected model weights at {model_file}") from None
+    if expected_model_size is not None and model_size != expected_model_size:
+        raise RuntimeError(
+            f"{model_file} has {model_size} bytes, expected {expected_model_size}"
+        )
 
     engine_dir = models_dir / 'rt_engine' / model_name
 
@@ -121,55 +435,60 @@ def build_engines(model_cache: _tp.Optional[str] = None, only_fp8=False):
     tp_pp_dir = f"tp{tp_size}-pp{pp_size}-gpu"
     input_file = 'input_tokens.npy'
 
-    if only_fp8:
+    if configs is None:
+        configs = FP8_CONFIGS if only_fp8 else FP16_CONFIGS
+    configs = set(configs)
+
+    builds = []
+    if configs.intersection(FP16_CONFIGS):
+        fp16_ckpt_path = engine_dir / 'fp16' / tp_pp_dir
+        get_ckpt_without_quatization(hf_dir, fp16_ckpt_path, reuse_engines)
+        model_spec_obj = model_spec.ModelSpec(input_file, _tb.DataType.HALF)
+        model_spec_obj.use_gpt_plugin()
+        for name, kv_cache_type, packed in [
+            ("fp16-plugin", _tb.KVCacheType.CONTINUOUS, False),
+            ("fp16-plugin-packed", _tb.KVCacheType.CONTINUOUS, True),
+            ("fp16-plugin-packed-paged", _tb.KVCacheType.PAGED, True),
+        ]:
+            model_spec_obj.set_kv_cache_type(kv_cache_type)
+            if packed:
+                model_spec_obj.use_packed_input()
+            if name not in configs:
+                continue
+            paged = kv_cache_type == _tb.KVCacheType.PAGED
+            builds.append(
+                (name, fp16_ckpt_path,
+                 engine_dir / model_spec_obj.get_model_path() / tp_pp_dir,
+                 BuildConfig(
+                     paged_kv_cache='enable' if paged else 'disable',
+                     remove_input_padding='enable' if packed else 'disable')))
+
+    if configs.intersection(FP8_CONFIGS):
         # with ifb, new plugin
-        print(
-            "\nBuilding fp8-plugin engine using gpt_attention_plugin with inflight-batching, packed"
-        )
         # TODO: use dummy scales atm; to re-enable when data is uploaded to the model cache
         # quantized_fp8_model_arg = '--quantized_fp8_model_path=' + \
         #     str(_pl.Path(model_cache) / 'fp8-quantized-modelopt' / 'gptj_tp1_rank0.npz')
         fp8_ckpt_path = engine_dir / 'fp8' / tp_pp_dir
-        get_ckpt_with_modelopt_quant(hf_dir, fp8_ckpt_path, model_cache)
+        get_ckpt_with_modelopt_quant(hf_dir, fp8_ckpt_path, model_cache,
+                                     reuse_engines)
         model_spec_obj = model_spec.ModelSpec(input_file, _tb.DataType.FP8)
         model_spec_obj.use_gpt_plugin()
         model_spec_obj.set_kv_cache_type(_tb.KVCacheType.PAGED)
         model_spec_obj.use_packed_input()
-        build_engine(fp8_ckpt_path,
-                     engine_dir / model_spec_obj.get_model_path() / tp_pp_dir,
-                     '--gpt_attention_plugin=float16',
-                     '--paged_kv_cache=enable', '--remove_input_padding=enable',
-                     "--context_fmha=disable")
-    else:
-        fp16_ckpt_path = engine_dir / 'fp16' / tp_pp_dir
-        get_ckpt_without_quatization(hf_dir, fp16_ckpt_path)
-        print("\nBuilding fp16-plugin engine")
-        model_spec_obj = model_spec.ModelSpec(input_file, _tb.DataType.HALF)
-        model_spec_obj.use_gpt_plugin()
-        model_spec_obj.set_kv_cache_type(_tb.KVCacheType.CONTINUOUS)
-
-        build_engine(fp16_ckpt_path,
-                     engine_dir / model_spec_obj.get_model_path() / tp_pp_dir,
-                     '--gpt_attention_plugin=float16',
-                     '--paged_kv_cache=disable',
-                     '--remove_input_padding=disable', "--context_fmha=disable")
+        builds.append(("fp8-plugin-packed-paged", fp8_ckpt_path,
+                       engine_dir / model_spec_obj.get_model_path() / tp_pp_dir,
+                       BuildConfig(paged_kv_cache='enable',
+                                   remove_input_padding='enable')))
 
-        print("\nBuilding fp16-plugin-packed engine")
-        model_spec_obj.use_packed_input()
-        build_engine(fp16_ckpt_path,
-                     engine_dir / model_spec_obj.get_model_path() / tp_pp_dir,
-                     '--gpt_attention_plugin=float16',
-                     '--paged_kv_cache=disable',
-                     '--remove_input_padding=enable', "--context_fmha=disable")
+    # The FP16 and FP8 conversions both read the HF weights, so they are only
+    # dropped from the page cache once the last conversion is done.
+    evict_file(model_file)
 
-        print("\nBuilding fp16-plugin-packed-paged engine")
-        model_spec_obj.set_kv_cache_type(_tb.KVCacheType.PAGED)
-        build_engine(fp16_ckpt_path,
-                     engine_dir / model_spec_obj.get_model_path() / tp_pp_dir,
-                     '--gpt_attention_plugin=float16',
-                     '--paged_kv_cache=enable', '--remove_input_padding=enable',
-                     "--context_fmha=disable")
-        print("Done.")
+    build_engines_parallel(builds,
+                           max_parallel_builds,
+                           use_daemon=daemon,
+                           reuse_engines=reuse_engines)
+    print("Done.")
 
 
 if __name__ == "__main__":
@@ -181,5 +500,41 @@ if __name__ == "__main__":
         "--only_fp8",
         action="store_true",
         help="Build engines for only FP8 tests. Implemented for H100 runners.")
+    parser.add_argument(
+        "--configs",
+        nargs="+",
+        choices=FP16_CONFIGS + FP8_CONFIGS,
+        default=None,
+        help="Engine configurations to build, e.g. all of them to build the "
+        "FP16 and FP8 engines in one parallel batch. Defaults to the FP16 "
+        "engines, or the FP8 engine with --only_fp8.")
+    parser.add_argument(
+        "--max_parallel_builds",
+        "--jobs",
+        type=int,
+        default=min(len(FP16_CONFIGS + FP8_CONFIGS),
+                    _os.cpu_count() or 1),
+        help="Maximum number of engines built concurrently. Builds only run "
+        "in parallel when there is one GPU available per build.")
+    parser.add_argument(
+        "--daemon",
+        action="store_true",
+        help="Run the builds in long-lived worker processes, one per GPU, "
+        "instead of starting trtllm-build for each engine.")
+    parser.add_argument(
+        "--gpu_id",
+        type=int,
+        default=None,
+        help="Run all builds on the GPU with this index among the visible "
+        "ones, by exporting CUDA_VISIBLE_DEVICES, and pin the script to the "
+        "matching share of CPUs. Use distinct ids to run several engine build "
+        "scripts side by side.")
+    parser.add_argument(
+        "--reuse_engines",
+        action="store_true",
+        help="Skip conversions and builds whose output was produced from the "
+        "same inputs, arguments, TensorRT-LLM/TensorRT/CUDA versions and GPU. "
+        "Changes to the TensorRT-LLM sources that keep the version are not "
+        "detected, so only use this when the tree is unchanged.")
 
     build_engines(**vars(parser.parse_args()))
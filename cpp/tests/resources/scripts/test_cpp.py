@@ -360,11 +360,19 @@ def prepare_all_model_tests(python_exe: str,
         _log.info("Skipping GPT tests")
 
     if run_gptj:
+        # Build the FP16 and FP8 engines in one parallel batch.
+        configs_arg = []
+        if run_fp8:
+            configs_arg = [
+                "--configs", "fp16-plugin", "fp16-plugin-packed",
+                "fp16-plugin-packed-paged", "fp8-plugin-packed-paged"
+            ]
         prepare_model_tests(model_name="gptj",
                             python_exe=python_exe,
                             root_dir=root_dir,
                             resources_dir=resources_dir,
-                            model_cache_arg=model_cache_arg)
+                            model_cache_arg=model_cache_arg,
+                            build_engines_arg=configs_arg)
         if run_fp8:
             only_fp8_arg = ["--only_fp8"]
             prepare_model_tests(model_name="gptj",
@@ -372,7 +380,8 @@ def prepare_all_model_tests(python_exe: str,
                                 root_dir=root_dir,
                                 resources_dir=resources_dir,
                                 model_cache_arg=model_cache_arg,
-                                only_fp8_arg=only_fp8_arg)
+                                only_fp8_arg=only_fp8_arg,
+                                build=False)
     else:
         _log.info("Skipping GPT-J tests")
 
@@ -498,7 +507,9 @@ def prepare_model_tests(model_name: str,
                         resources_dir: _pl.Path,
                         model_cache_arg=[],
                         only_fp8_arg=[],
-                        only_multi_gpu_arg=[]):
+                        only_multi_gpu_arg=[],
+                        build_engines_arg=[],
+                        build=True):
     scripts_dir = resources_dir / "scripts"
 
     model_env = {**_os.environ, "PYTHONPATH": f"examples/{model_name}"}
@@ -516,11 +527,17 @@ def prepare_model_tests(model_name: str,
     build_engines = [
         python_exe,
         str(scripts_dir / f"build_{model_name}_engines.py")
-    ] + model_cache_arg + only_fp8_arg + only_multi_gpu_arg + enc_dec_model_name_arg + beams_arg
+    ] + model_cache_arg + only_fp8_arg + only_multi_gpu_arg + enc_dec_model_name_arg + beams_arg + build_engines_arg
 
     if model_name in ['gpt']:
         build_engines += ['--clean']
-    run_command(build_engines, cwd=root_dir, env=model_env, timeout=1800)
+    if build:
+        # Extra build arguments may add engines that used to be built by a
+        # separate invocation, each with its own timeout.
+        run_command(build_engines,
+                    cwd=root_dir,
+                    env=model_env,
+                    timeout=3600 if build_engines_arg else 1800)
 
     model_env["PYTHONPATH"] = "examples"
     generate_expected_output = [
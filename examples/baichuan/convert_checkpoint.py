@@ -203,7 +203,7 @@ def convert_and_save_gptq(args, rank):
         model_version=args.model_version,
         logits_dtype=args.logits_dtype)
 
-    config.vocab_size = int((config.vocab_size + 63) / 64) * 64
+    config.vocab_size = (config.vocab_size + 63) & ~63
     model = BaichuanForCausalLM(config)
     weights = load_weights_from_gptq(config, args.quant_ckpt_path)
     model.load(weights)
@@ -4,12 +4,13 @@ import time
 import traceback
 from concurrent.futures import ThreadPoolExecutor, as_completed
 
-from transformers import AutoModelForCausalLM
+from transformers import AutoConfig, AutoModelForCausalLM
 
 import tensorrt_llm
 from tensorrt_llm.hlapi import QuantConfig
 from tensorrt_llm.mapping import Mapping
 from tensorrt_llm.models import GPTJConfig, GPTJForCausalLM
+from tensorrt_llm.models.convert_utils import has_safetensors
 from tensorrt_llm.quantization import QuantAlgo
 
 
@@ -80,9 +81,23 @@ def convert_and_save_hf(args):
     world_size = args.tp_size * args.pp_size
     quant_config = args_to_quant_config(args)
 
-    hf_model = AutoModelForCausalLM.from_pretrained(model_dir,
-                                                    torch_dtype='auto',
-                                                    trust_remote_code=True)
+    # Read the small config.json first; the weights are only loaded once
+    # everything that can be derived from the config is known.
+    hf_config = AutoConfig.from_pretrained(model_dir, trust_remote_code=True)
+    assert hf_config.num_attention_heads % args.tp_size == 0, \
+        f"num_attention_heads ({hf_config.num_attention_heads}) is not divisible by tp_size ({args.tp_size})"
+    assert args.pp_size <= hf_config.num_hidden_layers, \
+        f"pp_size ({args.pp_size}) exceeds num_hidden_layers ({hf_config.num_hidden_layers})"
+
+    # Safetensors checkpoints are read shard by shard in each rank, so the
+    # HF module is only instantiated for pytorch_model.bin checkpoints.
+    if has_safetensors(model_dir):
+        hf_model = model_dir
+    else:
+        hf_model = AutoModelForCausalLM.from_pretrained(model_dir,
+                                                        config=hf_config,
+                                                        torch_dtype='auto',
+                                                        trust_remote_code=True)
 
     def convert_and_save_rank(args, rank):
         mapping = Mapping(world_size=world_size,
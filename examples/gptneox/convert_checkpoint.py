@@ -15,8 +15,9 @@ from transformers import AutoConfig, AutoModelForCausalLM
 import tensorrt_llm
 from tensorrt_llm._utils import str_dtype_to_torch
 from tensorrt_llm.mapping import Mapping
-from tensorrt_llm.models.convert_utils import (get_weight, get_weight_and_bias,
-                                               split_matrix_tp)
+from tensorrt_llm.models.convert_utils import (SafetensorsParams, get_weight,
+                                               get_weight_and_bias,
+                                               has_safetensors, split_matrix_tp)
 from tensorrt_llm.quantization import QuantAlgo
 
 
@@ -179,15 +180,15 @@ def reorder_qkv_weight_or_bias(weight: torch.Tensor,
 
 
 def get_gptq_gptneox_group_size(quant_ckpt_path, hf_config):
-    gptq_model = safe_open(quant_ckpt_path, framework="pt", device=0)
+    gptq_model = safe_open(quant_ckpt_path, framework="pt", device="cpu")
     gptq_prefix = "gpt_neox."
     split_sym = "."
 
     def load(key, no_prefix=0):
         if no_prefix:
-            return gptq_model.get_tensor(key).cpu()
+            return gptq_model.get_tensor(key)
         else:
-            return gptq_model.get_tensor(gptq_prefix + key).cpu()
+            return gptq_model.get_tensor(gptq_prefix + key)
 
     hidden_size = hf_config.hidden_size
     prefix = "layers" + split_sym + "0" + split_sym
@@ -208,7 +209,16 @@ def load_from_gptq_gptneox(quant_ckpt_path,
     weights = {}
     tik = time.time()
 
-    gptq_model = safe_open(quant_ckpt_path, framework="pt", device=0)
+    # Start reading the whole checkpoint ahead, so that the per-tensor reads
+    # below hit the page cache instead of faulting in one tensor at a time.
+    if hasattr(os, 'posix_fadvise'):
+        fd = os.open(quant_ckpt_path, os.O_RDONLY)
+        try:
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+        finally:
+            os.close(fd)
+
+    gptq_model = safe_open(quant_ckpt_path, framework="pt", device="cpu")
     gptq_prefix = "gpt_neox."
     gptq_suffix_list = [".qweight", ".qzeros", ".scales"]
     split_sym = "."
@@ -219,9 +229,9 @@ def load_from_gptq_gptneox(quant_ckpt_path,
 
     def load(key, no_prefix=0):
         if no_prefix:
-            return gptq_model.get_tensor(key).cpu()
+            return gptq_model.get_tensor(key)
         else:
-            return gptq_model.get_tensor(gptq_prefix + key).cpu()
+            return gptq_model.get_tensor(gptq_prefix + key)
 
     def torch_split(v, dim):
         if v.shape[dim] % mapping.tp_size != 0:
@@ -512,7 +522,8 @@ def get_tllm_linear_weight(weight,
     return results
 
 
-def convert_hf_gptneox(hf_model,
+def convert_hf_gptneox(model_params,
+                       hf_config,
                        mapping: Mapping,
                        dtype='float32',
                        use_parallel_embedding=False,
@@ -523,14 +534,13 @@ def convert_hf_gptneox(hf_model,
     weights = {}
     tik = time.time()
 
-    model_params = dict(hf_model.named_parameters())
     dtype = getattr(torch, dtype)
-    num_attention_heads = hf_model.config.num_attention_heads
-    hidden_size = hf_model.config.hidden_size
+    num_attention_heads = hf_config.num_attention_heads
+    hidden_size = hf_config.hidden_size
     tensor_parallel = mapping.tp_size
     rank = mapping.rank
 
-    for l in range(hf_model.config.num_hidden_layers):
+    for l in range(hf_config.num_hidden_layers):
         prefix = f'gpt_neox.layers.{l}.'
         tllm_prex = f'transformer.layers.{l}.'
 
@@ -609,7 +619,7 @@ def convert_hf_gptneox(hf_model,
     if not use_parallel_embedding:
         weights['transformer.vocab_embedding.weight'] = embed_w
     else:
-        assert hf_model.config.vocab_size % tensor_parallel == 0
+        assert hf_config.vocab_size % tensor_parallel == 0
         weights['transformer.vocab_embedding.weight'] = split_matrix_tp(
             embed_w, tensor_parallel, rank, dim=sharding_dim)
 
@@ -653,8 +663,17 @@ if __name__ == '__main__':
         quant_algo = QuantAlgo.W4A16_GPTQ
 
     hf_config = AutoConfig.from_pretrained(args.model_dir)
-    hf_model = AutoModelForCausalLM.from_pretrained(args.model_dir,
-                                                    torch_dtype="auto")
+    # The GPTQ path reads every weight from the quantized checkpoint. The
+    # other paths read safetensors shards lazily, and only fall back to
+    # loading the HF model, once for all ranks, for .bin checkpoints.
+    model_params = None
+    if not (args.use_weight_only and args.weight_only_precision == 'int4_gptq'):
+        if has_safetensors(args.model_dir):
+            model_params = SafetensorsParams(args.model_dir)
+        else:
+            hf_model = AutoModelForCausalLM.from_pretrained(args.model_dir,
+                                                            torch_dtype="auto")
+            model_params = dict(hf_model.named_parameters())
 
     config = {
         'architecture': hf_config.architectures[0],
@@ -708,7 +727,8 @@ if __name__ == '__main__':
                 dtype=args.dtype)
         else:
             weights = convert_hf_gptneox(
-                hf_model,
+                model_params,
+                hf_config,
                 mapping,
                 dtype=args.dtype,
                 use_weight_only=args.use_weight_only,
@@ -94,6 +94,13 @@ def parse_arguments(args=None):
         default=False,
         action='store_true',
         help="Run several 10 iterations to profile the inference latencies.")
+    parser.add_argument(
+        '--cuda_graph_mode',
+        default=False,
+        action='store_true',
+        help=
+        "Whether or not to replay the generation steps with CUDA graphs. Only supported by the Python session."
+    )
     parser = add_common_args(parser)
 
     return parser.parse_args(args=args)
@@ -382,6 +389,11 @@ def main(args):
             "Debug mode is not supported in C++ session for now, fallback to Python session."
         )
         args.use_py_session = True
+    if args.cuda_graph_mode and not args.use_py_session:
+        logger.warning(
+            "CUDA graph mode is only exposed by the Python session for now, fallback to Python session."
+        )
+        args.use_py_session = True
     if args.return_all_generated_tokens and args.use_py_session:
         raise ValueError(
             "Returning all the generated tokens at each step is not supported in the Python session, use C++ session instead."
@@ -406,6 +418,8 @@ def main(args):
     )
     if not args.use_py_session:
         runner_kwargs.update(is_enc_dec=is_enc_dec)
+    else:
+        runner_kwargs.update(cuda_graph_mode=args.cuda_graph_mode)
     if args.medusa_choices is not None:
         args.medusa_choices = ast.literal_eval(args.medusa_choices)
         assert args.temperature == 1.0, "Medusa should use temperature == 1.0"
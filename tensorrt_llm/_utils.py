@@ -16,7 +16,6 @@ import copy
 import gc
 import inspect
 import json
-import math
 import struct
 import weakref
 from dataclasses import asdict
@@ -368,7 +367,7 @@ def mpi_broadcast(obj, root=0):
 
 
 def pad_vocab_size(vocab_size, tp_size):
-    return int(math.ceil(vocab_size / tp_size) * tp_size)
+    return (vocab_size + tp_size - 1) // tp_size * tp_size
 
 
 def to_dict(obj):
@@ -13,15 +13,18 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 import copy
+import hashlib
 import json
 import math
 import os
 import shutil
+import tempfile
 import time
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Dict, Optional, Union
 
+import filelock
 import numpy as np
 import tensorrt as trt
 
@@ -42,6 +45,42 @@ from .quantization import QuantAlgo, QuantMode
 from .version import __version__
 
 
+def _timing_cache_metadata_path(timing_cache: Union[str, Path]) -> str:
+    # The metadata intentionally sits next to the cache, e.g. model.cache.json
+    # next to the default model.cache, so that it is copied, shared and
+    # deleted together with the cache it describes. The serialized cache is
+    # left untouched so that other TensorRT tools can still read it.
+    return f'{timing_cache}.json'
+
+
+def _timing_cache_lock_path(timing_cache: Union[str, Path]) -> str:
+    # Unlike the metadata, the lock file carries no information, so it is kept
+    # out of the directory of the cache, which is the working directory for
+    # the default output path.
+    digest = hashlib.sha1(os.path.abspath(timing_cache).encode()).hexdigest()
+    return os.path.join(tempfile.gettempdir(),
+                        f'trtllm_timing_cache_{digest}.lock')
+
+
+def _timing_cache_metadata() -> dict:
+    import torch
+    return {
+        'tensorrt_version': trt.__version__,
+        'cuda_version': torch.version.cuda,
+        'compute_capability': list(torch.cuda.get_device_capability()),
+    }
+
+
+def _read_timing_cache_metadata(
+        timing_cache: Union[str, Path]) -> Optional[dict]:
+    # Timing caches saved by older versions have no metadata.
+    metadata_path = _timing_cache_metadata_path(timing_cache)
+    if not os.path.exists(metadata_path):
+        return None
+    with open(metadata_path) as f:
+        return json.load(f)
+
+
 class ConfigEncoder(json.JSONEncoder):
 
     def default(self, obj):
@@ -204,6 +243,7 @@ class Builder():
 
         # set timing cache
         cache = None
+        ignore_mismatch = False
         if timing_cache is not None:
             # use given cache
             if isinstance(timing_cache, trt.ITimingCache):
@@ -211,8 +251,15 @@ class Builder():
             # read cache from file
             elif isinstance(timing_cache,
                             (str, Path)) and os.path.exists(timing_cache):
-                with open(timing_cache, "rb") as f:
-                    cache = config.create_timing_cache(f.read())
+                metadata = _read_timing_cache_metadata(timing_cache)
+                if metadata is None or metadata == _timing_cache_metadata():
+                    with open(timing_cache, "rb") as f:
+                        cache = config.create_timing_cache(f.read())
+                    ignore_mismatch = metadata is not None
+                else:
+                    logger.warning(
+                        f"Timing cache {timing_cache} was saved with a different TensorRT, CUDA or GPU, using freshly created one"
+                    )
             else:
                 logger.warning(
                     "Invalid timing cache, using freshly created one")
@@ -221,7 +268,12 @@ class Builder():
         # When user does not given any existing cache, internally always created one
         # so the cache should never None here
         assert cache is not None and isinstance(cache, trt.ITimingCache)
-        config.set_timing_cache(cache, ignore_mismatch=False)
+        # ignore_mismatch lets TensorRT use a cache recorded on a device with
+        # different CUDA device properties, e.g. SM count or clocks. That is
+        # only allowed for caches whose metadata shows the same TensorRT,
+        # CUDA and compute capability, which other ranks or machines with the
+        # same GPU architecture produce.
+        config.set_timing_cache(cache, ignore_mismatch=ignore_mismatch)
 
         # set weight sparsity
         weight_sparsity = kwargs.get("weight_sparsity", False)
@@ -442,6 +494,7 @@ class Builder():
     @staticmethod
     def save_timing_cache(builder_config: BuilderConfig, out_path: str) -> bool:
         '''Serialize timing cache of given builder config to file specified by out_path
+            The TensorRT, CUDA and GPU the cache was recorded with are saved next to it, in out_path + '.json'
             return True if the cache is successfully serialized, False otherwise
         '''
         cache = builder_config.trt_builder_config.get_timing_cache()
@@ -450,11 +503,26 @@ class Builder():
                 'No timing cache found in the given builder config, skip saving.'
             )
             return False
-        with cache.serialize() as buffer:
-            with open(out_path, "wb") as f:
-                f.write(buffer)
-                f.flush()
-                os.fsync(f)
+        # Merge with the entries other ranks or earlier runs already saved to
+        # the same file under a lock, and replace it atomically so readers
+        # never see a partial cache.
+        with filelock.FileLock(_timing_cache_lock_path(out_path)):
+            metadata = _read_timing_cache_metadata(out_path)
+            if os.path.exists(out_path) and metadata in (
+                    None, _timing_cache_metadata()):
+                with open(out_path, "rb") as f:
+                    saved_cache = builder_config.trt_builder_config.create_timing_cache(
+                        f.read())
+                cache.combine(saved_cache, ignore_mismatch=metadata is not None)
+            tmp_path = f'{out_path}.{os.getpid()}.tmp'
+            with cache.serialize() as buffer:
+                with open(tmp_path, "wb") as f:
+                    f.write(buffer)
+                    f.flush()
+                    os.fsync(f)
+            os.replace(tmp_path, out_path)
+            to_json_file(_timing_cache_metadata(),
+                         _timing_cache_metadata_path(out_path))
         logger.info(f'Timing cache serialized to {out_path}')
         return True
 
@@ -1182,7 +1250,7 @@ def build(model: PretrainedModel,
         network, builder_config, managed_weights)
     engine_config = EngineConfig(model.config, build_config, __version__)
 
-    if build_config.output_timing_cache is not None and model.config.mapping.rank == 0:
+    if build_config.output_timing_cache is not None:
         ok = builder.save_timing_cache(builder_config,
                                        build_config.output_timing_cache)
         assert ok, "Failed to save timing cache."
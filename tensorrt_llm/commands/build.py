@@ -148,10 +148,13 @@ def parse_arguments():
         help=
         "The file path to read the timing cache. This option is ignored if the file does not exist."
     )
-    parser.add_argument('--output_timing_cache',
-                        type=str,
-                        default='model.cache',
-                        help="The file path to write the timing cache.")
+    parser.add_argument(
+        '--output_timing_cache',
+        type=str,
+        default='model.cache',
+        help=
+        "The file path to write the timing cache. The TensorRT, CUDA and GPU it was recorded with are written to the same path with a '.json' suffix, and a cache whose record does not match is not reused."
+    )
     parser.add_argument('--builder_opt',
                         type=int,
                         default=None,
@@ -196,10 +199,14 @@ def parse_arguments():
         "Enable features for faster engine building. This may cause some performance degradation and is currently incompatible with int8/int4 quantization.",
     )
 
-    parser.add_argument('--workers',
-                        type=int,
-                        default=1,
-                        help="The number of workers for building in parallel.")
+    parser.add_argument(
+        '--workers',
+        type=int,
+        default=None,
+        help=
+        "The number of workers for building in parallel. By default, one worker per rank when there is one GPU per rank, otherwise the ranks are built serially. "
+        "When no --input_timing_cache exists yet, rank 0 is built alone first and the other ranks reuse its timing cache: this adds one rank's build time to the wall time, but saves every other rank from re-tuning the same kernels."
+    )
     parser.add_argument('--log_level',
                         type=str,
                         default='info',
@@ -436,10 +443,28 @@ def parallel_build(model_config: PretrainedConfig,
     else:
         with ProcessPoolExecutor(mp_context=get_context('spawn'),
                                  max_workers=workers) as p:
+            ranks = range(world_size)
+            rank_build_config = build_config
+            # Without a timing cache to start from, build rank 0 first; the
+            # other ranks then start from its timing cache instead of each
+            # re-tuning every kernel.
+            input_timing_cache = build_config.input_timing_cache
+            build_rank0_first = build_config.output_timing_cache is not None \
+                and world_size > 1 \
+                and not (input_timing_cache is not None
+                         and os.path.exists(input_timing_cache))
+            if build_rank0_first:
+                passed = p.submit(build_and_save, 0, 0, ckpt_dir, build_config,
+                                  output_dir, log_level, model_config,
+                                  model_cls, **kwargs).result()
+                assert passed, "Engine building failed, please check error log."
+                ranks = range(1, world_size)
+                rank_build_config = copy.deepcopy(build_config)
+                rank_build_config.input_timing_cache = build_config.output_timing_cache
             futures = [
                 p.submit(build_and_save, rank, rank % workers, ckpt_dir,
-                         build_config, output_dir, log_level, model_config,
-                         model_cls, **kwargs) for rank in range(world_size)
+                         rank_build_config, output_dir, log_level, model_config,
+                         model_cls, **kwargs) for rank in ranks
             ]
             exceptions = []
             for future in as_completed(futures):
@@ -477,8 +502,6 @@ def main():
         mod = loader.load_module()
         model_cls = getattr(mod, args.model_cls_name)
 
-    workers = min(torch.cuda.device_count(), args.workers)
-
     if hasattr(args, 'paged_kv_cache'):
         logger.warning(
             'Option --paged_kv_cache is deprecated, use --kv_cache_type=paged/disabled instead.'
@@ -511,6 +534,14 @@ def main():
 
     model_config = PretrainedConfig.from_json_file(config_path)
 
+    # Build each rank on its own GPU when there is one GPU per rank. With fewer
+    # GPUs, ranks would share devices, so build them one after another.
+    workers = args.workers
+    if workers is None:
+        world_size = model_config.mapping.world_size
+        workers = world_size if torch.cuda.device_count() >= world_size else 1
+    workers = max(min(torch.cuda.device_count(), workers), 1)
+
     # avoid ValueError if not supported quantization is chosen with use_fused_mlp
     quant_algo = model_config.quantization.quant_algo
     if quant_algo and quant_algo != QuantAlgo.FP8:
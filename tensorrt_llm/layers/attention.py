@@ -276,7 +276,7 @@ class KeyValueCacheParams:
 
     def fill_none_tensor_list(self, list_size):
         if self.past_key_value is None:
-            self.past_key_value = tuple([None] * list_size)
+            self.past_key_value = (None, ) * list_size
 
     def is_valid(self, gpt_attention_plugin):
         if gpt_attention_plugin:
@@ -55,10 +55,8 @@ class BloomDecoderLayer(Module):
             reorder=True,
             quant_mode=config.quant_mode)
 
-        mlp_hidden_size = hidden_size * 4 if config.intermediate_size is None else config.intermediate_size
-
         self.mlp = MLP(hidden_size=hidden_size,
-                       ffn_hidden_size=mlp_hidden_size,
+                       ffn_hidden_size=config.intermediate_size,
                        hidden_act='gelu',
                        dtype=dtype,
                        bias=True,
@@ -1,5 +1,8 @@
 import fnmatch
+import pickle
 import re
+import zipfile
+from collections.abc import Mapping
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple, Union
 
@@ -154,7 +157,20 @@ def load_state_dict(
                 model_params[name] = tensor
     elif file_path.suffix == '.bin':
         # load from pytorch bin file
-        state_dict = torch.load(file_path, map_location=device)
+        state_dict = None
+        # Memory-map zip-format files so tensors are paged in on access.
+        # Legacy (non-zip) files and pickles holding non-tensor objects
+        # cannot be loaded this way and use the plain loader instead.
+        if zipfile.is_zipfile(file_path):
+            try:
+                state_dict = torch.load(file_path,
+                                        map_location=device,
+                                        mmap=True,
+                                        weights_only=True)
+            except (pickle.UnpicklingError, RuntimeError):
+                pass
+        if state_dict is None:
+            state_dict = torch.load(file_path, map_location=device)
         for name in state_dict:
             tensor = state_dict[name]
             if dtype is not None:
@@ -245,6 +261,30 @@ def has_safetensors(model_dir: str):
     return len(list(Path(model_dir).glob('*.safetensors'))) > 0
 
 
+class SafetensorsParams(Mapping):
+    """Maps parameter names to tensors read lazily from safetensors shards."""
+
+    def __init__(self, model_dir: str):
+        from safetensors import safe_open
+        self._shards = {}
+        for shard_file in sorted(Path(model_dir).glob('*.safetensors')):
+            f = safe_open(shard_file, framework='pt', device='cpu')
+            self._shards.update(dict.fromkeys(f.keys(), f))
+
+    def __getitem__(self, name: str) -> torch.Tensor:
+        return self._shards[name].get_tensor(name)
+
+    def __contains__(self, name) -> bool:
+        # Mapping.__contains__ would read the tensor through __getitem__.
+        return name in self._shards
+
+    def __iter__(self):
+        return iter(self._shards)
+
+    def __len__(self):
+        return len(self._shards)
+
+
 DEFAULT_HF_DATASET_META = {
     'ccdv/cnn_dailymail': ('3.0.0', 'train', 'article'),
     'cnn_dailymail': ('3.0.0', 'train', 'article'),
@@ -5,7 +5,8 @@ import torch
 
 from tensorrt_llm.quantization import QuantAlgo
 
-from ..convert_utils import get_weight, get_weight_and_bias, split_matrix_tp
+from ..convert_utils import (SafetensorsParams, get_weight, get_weight_and_bias,
+                             split_matrix_tp)
 from .config import GPTJConfig
 
 
@@ -54,7 +55,18 @@ def get_tllm_param(
     return results
 
 
-def load_weights_from_hf_model(hf_model, config: GPTJConfig):
+def load_weights_from_hf_safetensors(model_dir: str, config: GPTJConfig):
+    # Read the tensors straight from the shards instead of materializing
+    # the HF torch.nn.Module first.
+    return load_weights_from_hf_model(None,
+                                      config,
+                                      model_params=SafetensorsParams(model_dir))
+
+
+def load_weights_from_hf_model(
+        hf_model,
+        config: GPTJConfig,
+        model_params: Optional[Dict[str, torch.Tensor]] = None):
     quant_algo = config.quantization.quant_algo
     use_weight_only = quant_algo in [QuantAlgo.W8A16, QuantAlgo.W4A16]
     if quant_algo == QuantAlgo.W8A16:
@@ -67,7 +79,8 @@ def load_weights_from_hf_model(hf_model, config: GPTJConfig):
     weights = {}
     tik = time.time()
 
-    model_params = dict(hf_model.named_parameters())
+    if model_params is None:
+        model_params = dict(hf_model.named_parameters())
     dtype = getattr(torch, config.dtype)
     num_hidden_layers = config.num_hidden_layers
     mapping = config.mapping
@@ -21,10 +21,12 @@ from ...layers import (MLP, Attention, AttentionMaskType, ColumnLinear,
                        Embedding, LayerNorm)
 from ...mapping import Mapping
 from ...module import Module
+from ..convert_utils import has_safetensors
 from ..modeling_utils import (DecoderLayerList, DecoderModelForCausalLM,
                               check_share_embedding)
 from .config import GPTJConfig
-from .convert import load_weights_from_hf_model
+from .convert import (load_weights_from_hf_model,
+                      load_weights_from_hf_safetensors)
 
 
 class GPTJDecoderLayer(Module):
@@ -191,10 +193,14 @@ class GPTJForCausalLM(DecoderModelForCausalLM):
                                               quant_config=quant_config,
                                               **kwargs)
 
-        if not use_preloading:
+        if use_preloading:
+            weights = load_weights_from_hf_model(hf_model, config)
+        elif has_safetensors(hf_model_dir):
+            weights = load_weights_from_hf_safetensors(hf_model_dir, config)
+        else:
             hf_model = transformers.AutoModelForCausalLM.from_pretrained(
                 hf_model_dir, torch_dtype='auto', trust_remote_code=True)
-        weights = load_weights_from_hf_model(hf_model, config)
+            weights = load_weights_from_hf_model(hf_model, config)
 
         check_share_embedding(weights, config)
         model = GPTJForCausalLM(config)
@@ -85,6 +85,11 @@ PLUGIN_DTYPE_OPTIONS_MAP = {
 }
 
 
+def _get_plugin_dtype_options(field_name: str) -> list:
+    return PLUGIN_DTYPE_OPTIONS_MAP.get(field_name,
+                                        DEFAULT_PLUGIN_DTYPE_OPTIONS)
+
+
 def _make_plugin_property(field_name: str, field_type: type):
 
     def bind(field_name):
@@ -104,9 +109,7 @@ def _make_plugin_property(field_name: str, field_type: type):
                 assert isinstance(value, bool), \
                     f"Plugin {field_name} expects {field_type}, got {type(value)}"
             elif field_type in (str, Optional[str]):
-                plugin_dtype_options = DEFAULT_PLUGIN_DTYPE_OPTIONS
-                if field_name in PLUGIN_DTYPE_OPTIONS_MAP:
-                    plugin_dtype_options = PLUGIN_DTYPE_OPTIONS_MAP[field_name]
+                plugin_dtype_options = _get_plugin_dtype_options(field_name)
                 assert value in plugin_dtype_options, \
                     f"Plugin {field_name} expects values in {plugin_dtype_options}, got {value}"
             if field_name == 'dtype':
@@ -328,9 +331,7 @@ def add_plugin_argument(parser: argparse.ArgumentParser):
         if field_name not in cli_plugin_args:
             continue
         if field.type in (str, Optional[str]):
-            plugin_dtype_options = DEFAULT_PLUGIN_DTYPE_OPTIONS
-            if field_name in PLUGIN_DTYPE_OPTIONS_MAP:
-                plugin_dtype_options = PLUGIN_DTYPE_OPTIONS_MAP[field_name]
+            plugin_dtype_options = _get_plugin_dtype_options(field_name)
             parser.add_argument(
                 "--" + field_name,
                 type=str,
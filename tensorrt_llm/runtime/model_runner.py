@@ -512,19 +512,18 @@ class ModelRunner(ModelRunnerMixin):
         self.enable_context_fmha_fp32_acc = False
 
     @classmethod
-    def from_engine(
-            cls,
-            engine: Engine,
-            max_output_len: Optional[int] = None,
-            lora_dir: Optional[List[str]] = None,
-            rank: int = 0,
-            debug_mode: bool = False,
-            lora_ckpt_source: str = "hf",
-            medusa_choices: List[List[int]] = None,
-            stream: torch.cuda.Stream = None,
-            gpu_weights_percent: float = 1,
-            enable_context_fmha_fp32_acc: Optional[bool] = None
-    ) -> 'ModelRunner':
+    def from_engine(cls,
+                    engine: Engine,
+                    max_output_len: Optional[int] = None,
+                    lora_dir: Optional[List[str]] = None,
+                    rank: int = 0,
+                    debug_mode: bool = False,
+                    lora_ckpt_source: str = "hf",
+                    medusa_choices: List[List[int]] = None,
+                    stream: torch.cuda.Stream = None,
+                    gpu_weights_percent: float = 1,
+                    enable_context_fmha_fp32_acc: Optional[bool] = None,
+                    cuda_graph_mode: bool = False) -> 'ModelRunner':
         model_config = _engine_config_to_model_config(
             engine.config, gpu_weights_percent=gpu_weights_percent)
 
@@ -559,6 +558,7 @@ class ModelRunner(ModelRunnerMixin):
                               engine_buffer,
                               runtime_mapping,
                               debug_mode=debug_mode,
+                              cuda_graph_mode=cuda_graph_mode,
                               stream=stream)
         if session.runtime.engine.streamable_weights_size:
             session.runtime._set_weight_streaming(gpu_weights_percent)
@@ -584,19 +584,18 @@ class ModelRunner(ModelRunnerMixin):
         return runner
 
     @classmethod
-    def from_dir(
-            cls,
-            engine_dir: str,
-            max_output_len: Optional[int] = None,
-            lora_dir: Optional[List[str]] = None,
-            rank: int = 0,
-            debug_mode: bool = False,
-            lora_ckpt_source: str = "hf",
-            medusa_choices: List[List[int]] = None,
-            stream: torch.cuda.Stream = None,
-            gpu_weights_percent: float = 1,
-            enable_context_fmha_fp32_acc: Optional[bool] = None
-    ) -> 'ModelRunner':
+    def from_dir(cls,
+                 engine_dir: str,
+                 max_output_len: Optional[int] = None,
+                 lora_dir: Optional[List[str]] = None,
+                 rank: int = 0,
+                 debug_mode: bool = False,
+                 lora_ckpt_source: str = "hf",
+                 medusa_choices: List[List[int]] = None,
+                 stream: torch.cuda.Stream = None,
+                 gpu_weights_percent: float = 1,
+                 enable_context_fmha_fp32_acc: Optional[bool] = None,
+                 cuda_graph_mode: bool = False) -> 'ModelRunner':
         """
         Create a ModelRunner instance from an engine directory.
 
@@ -615,6 +614,8 @@ class ModelRunner(ModelRunnerMixin):
                 Medusa choices to use when in Medusa decoding
             stream (torch.cuda.Stream):
                 Stream to use.
+            cuda_graph_mode (bool):
+                Whether or not to replay the generation steps with CUDA graphs.
         Returns:
             ModelRunner: An instance of ModelRunner.
         """
@@ -661,6 +662,7 @@ class ModelRunner(ModelRunnerMixin):
                                   engine_buffer,
                                   runtime_mapping,
                                   debug_mode=debug_mode,
+                                  cuda_graph_mode=cuda_graph_mode,
                                   stream=stream)
             if session.use_lora_plugin:
                 lora_manager = LoraManager()
@@ -700,10 +702,16 @@ class ModelRunner(ModelRunnerMixin):
                     ]
                     lora_ckpt_source = engine.config.build_config.lora_config.lora_ckpt_source
 
-            runner = ModelRunner.from_engine(engine, max_output_len, lora_dir,
-                                             rank, debug_mode, lora_ckpt_source,
-                                             medusa_choices, stream,
-                                             gpu_weights_percent)
+            runner = ModelRunner.from_engine(engine,
+                                             max_output_len,
+                                             lora_dir,
+                                             rank,
+                                             debug_mode,
+                                             lora_ckpt_source,
+                                             medusa_choices,
+                                             stream,
+                                             gpu_weights_percent,
+                                             cuda_graph_mode=cuda_graph_mode)
             profiler.stop('load tensorrt_llm engine')
             loading_time = profiler.elapsed_time_in_sec(
                 "load tensorrt_llm engine")
@@ -0,0 +1,116 @@
+# SPDX-FileCopyrightText: Copyright (c) 2022-2024 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import os
+import tempfile
+import unittest
+
+import torch
+from safetensors.torch import save_file
+
+from tensorrt_llm.models.convert_utils import SafetensorsParams, load_state_dict
+
+
+class TestSafetensorsParams(unittest.TestCase):
+
+    def setUp(self):
+        torch.manual_seed(0)
+        model = torch.nn.Sequential(torch.nn.Linear(8, 16),
+                                    torch.nn.LayerNorm(16),
+                                    torch.nn.Linear(16, 4, bias=False))
+        self.named_params = {
+            name: param.detach().clone()
+            for name, param in model.named_parameters()
+        }
+
+        # Split the weights over two shards, like a sharded HF checkpoint.
+        self.model_dir = tempfile.TemporaryDirectory()
+        names = sorted(self.named_params)
+        for i, shard in enumerate((names[:2], names[2:])):
+            save_file({name: self.named_params[name]
+                       for name in shard},
+                      os.path.join(self.model_dir.name,
+                                   f'model-{i:05d}-of-00002.safetensors'))
+
+    def tearDown(self):
+        self.model_dir.cleanup()
+
+    def test_matches_named_parameters(self):
+        params = SafetensorsParams(self.model_dir.name)
+        self.assertEqual(len(params), len(self.named_params))
+        self.assertEqual(sorted(params), sorted(self.named_params))
+        for name, param in self.named_params.items():
+            self.assertIn(name, params)
+            torch.testing.assert_close(params[name], param, rtol=0, atol=0)
+        self.assertNotIn('missing.weight', params)
+        with self.assertRaises(KeyError):
+            params['missing.weight']
+
+    def test_contains_does_not_read(self):
+        reads = []
+
+        class CountingParams(SafetensorsParams):
+
+            def __getitem__(self, name):
+                reads.append(name)
+                return super().__getitem__(name)
+
+        params = CountingParams(self.model_dir.name)
+        for name in self.named_params:
+            self.assertIn(name, params)
+        self.assertEqual(reads, [])
+
+
+class TestLoadStateDict(unittest.TestCase):
+
+    def setUp(self):
+        torch.manual_seed(0)
+        self.state_dict = {
+            'lm_head.weight': torch.randn(16, 8, dtype=torch.float16),
+            'lm_head.bias': torch.randn(16, dtype=torch.float16),
+        }
+        self.model_dir = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.model_dir.cleanup()
+
+    def check_load(self, file_path):
+        params = load_state_dict(file_path)
+        self.assertEqual(sorted(params), sorted(self.state_dict))
+        for name, tensor in self.state_dict.items():
+            torch.testing.assert_close(params[name], tensor, rtol=0, atol=0)
+
+        params = load_state_dict(file_path, dtype=torch.float32)
+        for name, tensor in self.state_dict.items():
+            self.assertEqual(params[name].dtype, torch.float32)
+            torch.testing.assert_close(params[name],
+                                       tensor.float(),
+                                       rtol=0,
+                                       atol=0)
+
+    def test_zipfile_format(self):
+        file_path = os.path.join(self.model_dir.name, 'pytorch_model.bin')
+        torch.save(self.state_dict, file_path)
+        self.check_load(file_path)
+
+    def test_legacy_format(self):
+        file_path = os.path.join(self.model_dir.name, 'adapter_model.bin')
+        torch.save(self.state_dict,
+                   file_path,
+                   _use_new_zipfile_serialization=False)
+        self.check_load(file_path)
+
+
+if __name__ == '__main__':
+    unittest.main()
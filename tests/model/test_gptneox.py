@@ -101,7 +101,8 @@ class TestGPTNeoX(unittest.TestCase):
             "share_embedding_table": False
         }
         config = tensorrt_llm.models.PretrainedConfig.from_dict(config)
-        weights = convert_hf_gptneox(hf_gpt,
+        weights = convert_hf_gptneox(dict(hf_gpt.named_parameters()),
+                                     hf_gpt.config,
                                      mapping=Mapping(rank=rank,
                                                      world_size=tensor_parallel,
                                                      tp_size=tensor_parallel),
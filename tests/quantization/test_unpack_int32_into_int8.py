@@ -0,0 +1,67 @@
+# SPDX-FileCopyrightText: Copyright (c) 2022-2024 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import unittest
+
+import torch
+from parameterized import parameterized
+
+from tensorrt_llm.quantization.layers import unpack_int32_into_int8
+
+
+def reference_unpack_int32_into_int8(w_packed):
+    w_packed_int4x2 = w_packed.contiguous().view(torch.uint8)
+    w_unpacked = torch.zeros(w_packed_int4x2.shape[0],
+                             w_packed_int4x2.shape[1] * 2,
+                             dtype=torch.int8)
+    w_unpacked[:, ::2] = w_packed_int4x2 % 16
+    w_unpacked[:, 1::2] = w_packed_int4x2 // 16
+    return w_unpacked.contiguous()
+
+
+class TestUnpackInt32IntoInt8(unittest.TestCase):
+
+    @parameterized.expand([
+        ((1, 1), torch.int32),
+        ((64, 16), torch.int32),
+        ((96, 48), torch.int32),
+        ((64, 16), torch.float32),
+    ])
+    def test_matches_reference(self, shape, dtype):
+        torch.manual_seed(0)
+        w_packed = torch.randint(torch.iinfo(torch.int32).min,
+                                 torch.iinfo(torch.int32).max,
+                                 shape,
+                                 dtype=torch.int32).view(dtype)
+
+        w_unpacked = unpack_int32_into_int8(w_packed)
+
+        self.assertEqual(w_unpacked.dtype, torch.int8)
+        self.assertEqual(w_unpacked.shape, (shape[0], shape[1] * 8))
+        self.assertTrue(w_unpacked.is_contiguous())
+        self.assertTrue(
+            torch.equal(w_unpacked, reference_unpack_int32_into_int8(w_packed)))
+
+    def test_non_contiguous_input(self):
+        torch.manual_seed(0)
+        w_packed = torch.randint(-2**31, 2**31 - 1, (16, 32),
+                                 dtype=torch.int32).t()
+
+        self.assertTrue(
+            torch.equal(unpack_int32_into_int8(w_packed),
+                        reference_unpack_int32_into_int8(w_packed)))
+
+
+if __name__ == '__main__':
+    unittest.main()